@@ -2,7 +2,7 @@
 
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, Response
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
@@ -302,6 +302,41 @@ async def get_quotation_excel(
         raise
 
 
+@router.head(
+    "/quotations/{quotation_id}/excel",
+    summary="檢查 Excel 報價單是否可下載",
+)
+async def head_quotation_excel(
+    quotation_id: str,
+    *,
+    store: StoreDep,
+) -> Response:
+    """
+    檢查報價單 Excel 是否已產出（不觸發產出、不傳送檔案）.
+
+    **行為**：
+    - 200 OK：Excel 已產出，可用 GET 下載
+    - 202 Accepted：正在產出中
+    - 404 Not Found：報價單不存在，或 Excel 尚未開始產出／產出失敗（需以 GET 觸發）
+
+    供客戶端輪詢就緒狀態，檔案就緒後再發出一次 GET 下載。
+    """
+    try:
+        quotation = store.get_quotation(quotation_id)
+
+        if quotation.export_status == "completed" and quotation.export_path:
+            return Response(status_code=200)
+
+        if quotation.export_status == "generating":
+            return Response(status_code=202)
+
+        return Response(status_code=404)
+
+    except Exception as e:
+        log_error(e, context=f"Head quotation Excel: {quotation_id}")
+        raise
+
+
 async def _export_excel_background(
     quotation_id: str,
     task_id: str,
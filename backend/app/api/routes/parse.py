@@ -1,11 +1,12 @@
 """Parse API routes."""
 
+import hashlib
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, Request, Response
 from pydantic import BaseModel
 
-from ...models import ProcessingTask, APIResponse, BOQItemResponse
+from ...models import ProcessingTask, APIResponse, BOQItem, BOQItemResponse, ExtractedImage, SourceDocument
 from ...api.dependencies import StoreDep
 from ...services.parsing_service import parse_pdf_background
 from ...store import InMemoryStore
@@ -84,6 +85,20 @@ async def start_parsing(
         raise
 
 
+def _parse_result_etag(
+    document: SourceDocument, items: List[BOQItem], images: List[ExtractedImage]
+) -> str:
+    """
+    Build the parse-result ETag from document state instead of the payload.
+
+    以文件 ID、解析完成時間、項目與圖片數量及最後一次項目更新時間計算，
+    不需序列化含 photo_base64 的完整結果。
+    """
+    last_update = max((item.updated_at for item in items), default=None)
+    state = f"{document.id}|{document.processed_at}|{len(items)}|{len(images)}|{last_update}"
+    return '"%s"' % hashlib.sha1(state.encode("utf-8")).hexdigest()
+
+
 @router.get(
     "/documents/{document_id}/parse-result",
     response_model=APIResponse,
@@ -91,6 +106,8 @@ async def start_parsing(
 )
 async def get_parse_result(
     document_id: str,
+    request: Request,
+    response: Response,
     *,
     store: StoreDep,
 ) -> dict:
@@ -100,6 +117,7 @@ async def get_parse_result(
     - 返回解析出的所有項目
     - 包含提取的圖片資訊
     - 提供統計資訊
+    - 完成的結果帶有 ETag（依文件狀態計算），If-None-Match 相符時直接回傳 304
     """
     try:
         # Get document
@@ -130,20 +148,28 @@ async def get_parse_result(
         items = store.get_items_by_document(document_id)
         images = store.get_images_by_document(document_id)
 
+        # 先以文件狀態比對 ETag，相符時不組裝項目資料
+        etag = _parse_result_etag(document, items, images)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        data = {
+            "document_id": document_id,
+            "items": [BOQItemResponse.from_boq_item(item).model_dump() for item in items],
+            "images": [image.model_dump() for image in images],
+            "statistics": {
+                "total_items": len(items),
+                "items_with_qty": sum(1 for item in items if item.qty is not None),
+                "items_with_photo": sum(1 for item in items if item.photo_base64),
+                "total_images": len(images),
+            },
+        }
+
         return {
             "success": True,
             "message": f"成功取得解析結果：{len(items)} 個項目",
-            "data": {
-                "document_id": document_id,
-                "items": [BOQItemResponse.from_boq_item(item).model_dump() for item in items],
-                "images": [image.model_dump() for image in images],
-                "statistics": {
-                    "total_items": len(items),
-                    "items_with_qty": sum(1 for item in items if item.qty is not None),
-                    "items_with_photo": sum(1 for item in items if item.photo_base64),
-                    "total_images": len(images),
-                },
-            },
+            "data": data,
         }
 
     except Exception as e:
@@ -12,6 +12,7 @@ import logging
 import uuid
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
+from datetime import datetime
 
 from fastapi import APIRouter, File, Query, UploadFile
 from fastapi.responses import StreamingResponse
@@ -203,6 +204,7 @@ async def _process_core(
                             matched_images += 1
 
         doc.parse_status = "completed"
+        doc.processed_at = datetime.now()
         doc.extracted_items_count = len(boq_items)
         store.update_document(doc)
 
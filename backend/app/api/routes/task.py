@@ -1,17 +1,40 @@
 """Task status API routes."""
 
+import asyncio
 import logging
+from collections.abc import AsyncGenerator
 from typing import Optional
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 
-from ...models import APIResponse
+from ...models import APIResponse, ProcessingTask
 from ...api.dependencies import StoreDep
 from ...utils import log_error
+from ...utils.sse import format_sse_event
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["Task"])
 
+# SSE 事件串流檢查任務狀態的間隔（秒）
+TASK_EVENTS_CHECK_INTERVAL = 0.5
+
+
+def _task_to_dict(task: ProcessingTask) -> dict:
+    """轉換任務為 API 回應格式."""
+    return {
+        "task_id": task.task_id,
+        "task_type": task.task_type,
+        "status": task.status,
+        "progress": task.progress,
+        "message": task.message,
+        "created_at": task.created_at.isoformat() if task.created_at else None,
+        "started_at": task.started_at.isoformat() if task.started_at else None,
+        "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+        "result": task.result,
+        "error": task.error,
+    }
+
 
 @router.get(
     "/tasks/{task_id}",
@@ -35,18 +58,7 @@ async def get_task_status(
         return {
             "success": True,
             "message": f"任務狀態：{task.status}",
-            "data": {
-                "task_id": task.task_id,
-                "task_type": task.task_type,
-                "status": task.status,
-                "progress": task.progress,
-                "message": task.message,
-                "created_at": task.created_at.isoformat() if task.created_at else None,
-                "started_at": task.started_at.isoformat() if task.started_at else None,
-                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                "result": task.result,
-                "error": task.error,
-            },
+            "data": _task_to_dict(task),
         }
 
     except Exception as e:
@@ -54,6 +66,66 @@ async def get_task_status(
         raise
 
 
+@router.get(
+    "/tasks/{task_id}/events",
+    summary="透過 SSE 串流訂閱任務狀態",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "SSE 事件串流",
+            "content": {"text/event-stream": {}},
+        },
+    },
+)
+async def stream_task_events(
+    task_id: str,
+    *,
+    store: StoreDep,
+) -> StreamingResponse:
+    """
+    透過 SSE 串流推送任務狀態變化，取代客戶端輪詢.
+
+    - **task_id**: 任務 ID
+    - 每次狀態、進度或訊息變化時推送 `status` 事件（資料同 GET /tasks/{task_id}）
+    - 任務進入 completed / failed 後關閉串流
+    """
+    # 先確認任務存在，讓不存在的任務直接回應 404 而非空串流
+    task = store.get_task(task_id)
+
+    async def event_generator() -> AsyncGenerator[str, None]:
+        """SSE 事件生成器."""
+        current = task
+        last_state = None
+
+        while True:
+            state = (current.status, current.progress, current.message)
+            if state != last_state:
+                last_state = state
+                yield format_sse_event("status", _task_to_dict(current))
+
+            if current.status in ("completed", "failed"):
+                break
+
+            await asyncio.sleep(TASK_EVENTS_CHECK_INTERVAL)
+
+            try:
+                current = store.get_task(task_id)
+            except Exception as e:
+                # 任務在串流期間過期或被清除
+                logger.warning(f"Task {task_id} disappeared during event stream: {e}")
+                break
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get(
     "/tasks",
     response_model=APIResponse,
@@ -62,6 +134,7 @@ async def get_task_status(
 async def list_tasks(
     limit: int = Query(20, le=100, description="回傳數量限制"),
     status: Optional[str] = Query(None, regex="^(pending|processing|completed|failed)$", description="篩選狀態"),
+    ids: Optional[str] = Query(None, description="以逗號分隔的任務 ID（批次查詢狀態）"),
     *,
     store: StoreDep,
 ) -> dict:
@@ -70,34 +143,29 @@ async def list_tasks(
 
     - **limit**: 回傳數量限制（最多 100）
     - **status**: 篩選狀態（pending/processing/completed/failed）
+    - **ids**: 只回傳指定的任務（不受 limit 限制，不存在的 ID 會被略過）
     """
     try:
         tasks = store.list_tasks()
 
+        # Filter by task IDs (batch status query)
+        if ids:
+            wanted = {task_id for task_id in ids.split(",") if task_id}
+            tasks = [t for t in tasks if t.task_id in wanted]
+
         # Filter by status
         if status:
             tasks = [t for t in tasks if t.status == status]
 
         # Apply limit
-        tasks = tasks[:limit]
+        if not ids:
+            tasks = tasks[:limit]
 
         return {
             "success": True,
             "message": f"取得 {len(tasks)} 個任務",
             "data": {
-                "tasks": [
-                    {
-                        "task_id": t.task_id,
-                        "task_type": t.task_type,
-                        "status": t.status,
-                        "progress": t.progress,
-                        "message": t.message,
-                        "created_at": t.created_at.isoformat() if t.created_at else None,
-                        "started_at": t.started_at.isoformat() if t.started_at else None,
-                        "completed_at": t.completed_at.isoformat() if t.completed_at else None,
-                    }
-                    for t in tasks
-                ],
+                "tasks": [_task_to_dict(t) for t in tasks],
                 "total": len(tasks),
             },
         }
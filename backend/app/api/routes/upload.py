@@ -1,6 +1,7 @@
 """Upload API routes with auto-parsing."""
 
 import logging
+from datetime import datetime
 
 from fastapi import APIRouter, BackgroundTasks, File, Query, UploadFile
 from fastapi.responses import FileResponse
@@ -88,6 +89,7 @@ async def upload_files(
                     # 數量總表跳過 BOQ 解析（會在合併時由 quantity_parser 處理）
                     if document_role == "quantity_summary":
                         doc.parse_status = "completed"
+                        doc.processed_at = datetime.now()
                         doc.parse_message = "數量總表，跳過 BOQ 解析"
                         store.update_document(doc)
                         logger.info(f"Skipping BOQ parsing for quantity summary: {filename}")
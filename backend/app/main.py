@@ -5,6 +5,7 @@ import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from .config import settings
@@ -87,6 +88,28 @@ async def lifespan(app: FastAPI):
     logger.info("Application stopped")
 
 
+# 不經 gzip 的端點：SSE 串流（GZipMiddleware 會緩衝事件直到壓縮區塊填滿）
+# 與已壓縮的檔案下載（.xlsx 本身即為 zip、圖片為 PNG/JPEG）
+_GZIP_EXCLUDED_SUFFIXES = ("/events", "/stream", "/excel")
+_GZIP_EXCLUDED_PREFIXES = ("/api/v1/images/",)
+
+
+class JSONGZipMiddleware(GZipMiddleware):
+    """GZip middleware for JSON API responses.
+
+    SSE 串流與檔案下載端點直接略過壓縮，只有 JSON 回應會被壓縮。
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and (
+            scope["path"].endswith(_GZIP_EXCLUDED_SUFFIXES)
+            or scope["path"].startswith(_GZIP_EXCLUDED_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="家具報價單系統",
@@ -105,6 +128,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 大型 JSON 回應（文件列表、解析結果）以 gzip 壓縮傳輸
+app.add_middleware(JSONGZipMiddleware, minimum_size=1000)
+
 
 # Error handler for APIError
 @app.exception_handler(APIError)
@@ -6,6 +6,7 @@
 
 import asyncio
 import logging
+from datetime import datetime
 from typing import List, Optional
 
 from ..models import BOQItem
@@ -145,6 +146,7 @@ async def _do_parse_pdf(
 
         # Update document
         document.parse_status = "completed"
+        document.processed_at = datetime.now()
         document.parse_message = f"成功解析 {len(boq_items)} 個項目"
         document.extracted_items_count = len(boq_items)
         document.extracted_images_count = len(images_with_bytes)
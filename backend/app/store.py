@@ -172,6 +172,7 @@ class InMemoryStore:
     def update_boq_item(self, item: BOQItem) -> None:
         if item.id not in self.boq_items:
             raise_error(ErrorCode.RESOURCE_NOT_FOUND, "項目不存在", status_code=404)
+        item.updated_at = datetime.now()
         self.boq_items[item.id] = item
         logger.info(f"BOQ item updated: {item.id}")
 
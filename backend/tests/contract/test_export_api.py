@@ -4,6 +4,9 @@ import pytest
 from fastapi.testclient import TestClient
 from pathlib import Path
 
+from app.models import Quotation
+from app.store import get_store
+
 
 pytestmark = pytest.mark.contract
 
@@ -194,6 +197,65 @@ class TestExportExcelEndpoint:
             ) or "application/octet-stream" in response.headers.get("content-type", "")
 
 
+class TestHeadExcelEndpoint:
+    """Contract tests for HEAD /api/v1/quotations/{quotation_id}/excel endpoint."""
+
+    def test_head_excel_quotation_not_found(self, client: TestClient):
+        """Test probing Excel for non-existent quotation."""
+        response = client.head("/api/v1/quotations/invalid-id/excel")
+
+        assert response.status_code == 404
+
+    def test_head_excel_does_not_trigger_generation(self, client: TestClient, sample_pdf_file: Path):
+        """Test HEAD reports 404 before export starts and never starts it."""
+        with open(sample_pdf_file, "rb") as f:
+            upload_response = client.post(
+                "/api/v1/documents",
+                files={"files": (sample_pdf_file.name, f, "application/pdf")},
+            )
+
+        doc_id = upload_response.json()["data"]["documents"][0]["id"]
+
+        quotation_response = client.post(
+            "/api/v1/quotations",
+            json={"document_ids": [doc_id]},
+        )
+
+        quotation_id = quotation_response.json()["data"]["id"]
+
+        response = client.head(f"/api/v1/quotations/{quotation_id}/excel")
+
+        assert response.status_code == 404
+        assert response.content == b""
+
+        quotation = client.get(f"/api/v1/quotations/{quotation_id}").json()["data"]
+        assert quotation["export_status"] == "pending"
+
+
+class TestExcelDownloadEncoding:
+    """Contract tests for GET /api/v1/quotations/{quotation_id}/excel encoding."""
+
+    def test_excel_download_not_gzipped(self, client: TestClient, tmp_path: Path):
+        """Test the .xlsx download (already zip-compressed) is sent without gzip."""
+        excel_path = tmp_path / "quotation.xlsx"
+        excel_path.write_bytes(b"PK" + b"\x00" * 4096)
+        quotation = Quotation(
+            title="gzip",
+            export_status="completed",
+            export_path=str(excel_path),
+        )
+        get_store().add_quotation(quotation)
+
+        response = client.get(
+            f"/api/v1/quotations/{quotation.id}/excel",
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.content == excel_path.read_bytes()
+
+
 class TestGetQuotationItemsEndpoint:
     """Contract tests for GET /api/v1/quotations/{quotation_id}/items endpoint (US4)."""
 
@@ -4,6 +4,9 @@ import pytest
 from fastapi.testclient import TestClient
 from pathlib import Path
 
+from app.models import BOQItem, SourceDocument
+from app.store import get_store
+
 
 pytestmark = pytest.mark.contract
 
@@ -155,3 +158,58 @@ class TestParseResultEndpoint:
             elif "data" in data and isinstance(data["data"], dict):
                 # Check in data wrapper
                 assert "items" in data["data"] or "results" in data["data"]
+
+    def test_parse_result_etag_not_modified(self, client: TestClient):
+        """Test completed parse result returns ETag and honours If-None-Match."""
+        doc = SourceDocument(
+            filename="etag.pdf",
+            file_path="/tmp/etag.pdf",
+            file_size=1000,
+            parse_status="completed",
+        )
+        get_store().add_document(doc)
+
+        response = client.get(f"/api/v1/documents/{doc.id}/parse-result")
+
+        assert response.status_code == 200
+        etag = response.headers.get("etag")
+        assert etag
+
+        cached = client.get(
+            f"/api/v1/documents/{doc.id}/parse-result",
+            headers={"If-None-Match": etag},
+        )
+
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+    def test_parse_result_etag_changes_after_item_update(self, client: TestClient):
+        """Test an item update invalidates the parse-result ETag."""
+        doc = SourceDocument(
+            filename="etag-update.pdf",
+            file_path="/tmp/etag-update.pdf",
+            file_size=1000,
+            parse_status="completed",
+        )
+        store = get_store()
+        store.add_document(doc)
+        item = BOQItem(
+            no=1,
+            item_no="DLX-100",
+            description="Sofa",
+            source_document_id=doc.id,
+        )
+        store.add_boq_item(item)
+
+        etag = client.get(f"/api/v1/documents/{doc.id}/parse-result").headers["etag"]
+
+        item.qty = 2.0
+        store.update_boq_item(item)
+        response = client.get(
+            f"/api/v1/documents/{doc.id}/parse-result",
+            headers={"If-None-Match": etag},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["data"]["items"][0]["qty"] == 2.0
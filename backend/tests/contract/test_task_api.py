@@ -1,9 +1,14 @@
 """Contract tests for task API endpoints (US1)."""
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from pathlib import Path
 
+from app.models import ProcessingTask
+from app.store import get_store
+
 
 pytestmark = pytest.mark.contract
 
@@ -118,9 +123,51 @@ class TestTaskStatusEndpoint:
         assert task["message"] is not None
 
 
+class TestTaskEventsEndpoint:
+    """Contract tests for GET /api/v1/tasks/{task_id}/events endpoint."""
+
+    def test_task_events_not_found(self, client: TestClient):
+        """Test subscribing to a non-existent task."""
+        response = client.get("/api/v1/tasks/invalid-id/events")
+
+        assert response.status_code == 404
+
+    def test_task_events_completed_task(self, client: TestClient):
+        """Test completed task emits one status event and closes the stream."""
+        task = ProcessingTask(task_type="parse_pdf")
+        task.complete(result={"items": 3})
+        get_store().add_task(task)
+
+        response = client.get(f"/api/v1/tasks/{task.task_id}/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "content-encoding" not in response.headers
+
+        data_lines = [line for line in response.text.split("\n") if line.startswith("data: ")]
+        assert len(data_lines) == 1
+
+        event = json.loads(data_lines[0][6:])
+        assert event["task_id"] == task.task_id
+        assert event["status"] == "completed"
+        assert event["progress"] == 100
+
+
 class TestTaskListEndpoint:
     """Contract tests for GET /api/v1/tasks endpoint."""
 
+    def test_list_tasks_gzip_compressed(self, client: TestClient):
+        """Test large task lists are gzip-compressed when the client accepts it."""
+        store = get_store()
+        for _ in range(20):
+            store.add_task(ProcessingTask(task_type="parse_pdf"))
+
+        response = client.get("/api/v1/tasks", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        assert response.json()["success"] is True
+
     def test_list_tasks_empty(self, client: TestClient):
         """Test listing tasks when none exist."""
         response = client.get("/api/v1/tasks")
@@ -157,3 +204,33 @@ class TestTaskListEndpoint:
             task = tasks[0]
             assert "task_id" in task or "id" in task
             assert "status" in task
+
+    def test_list_tasks_filtered_by_ids(self, client: TestClient):
+        """Test batch status query returns only the requested tasks."""
+        store = get_store()
+        first = ProcessingTask(task_type="parse_pdf")
+        second = ProcessingTask(task_type="parse_pdf")
+        third = ProcessingTask(task_type="parse_pdf")
+        other = ProcessingTask(task_type="parse_pdf")
+        second.fail("解析失敗")
+        third.complete(result={"items": 3})
+        for task in (first, second, third, other):
+            store.add_task(task)
+
+        response = client.get(
+            "/api/v1/tasks",
+            params={"ids": f"{first.task_id},{second.task_id},{third.task_id},missing-id"},
+        )
+
+        assert response.status_code == 200
+        tasks = {t["task_id"]: t for t in response.json()["data"]["tasks"]}
+        assert set(tasks) == {first.task_id, second.task_id, third.task_id}
+        assert tasks[first.task_id]["status"] == "pending"
+        assert tasks[second.task_id]["status"] == "failed"
+        assert tasks[second.task_id]["error"] == "解析失敗"
+        assert tasks[third.task_id]["status"] == "completed"
+        assert tasks[third.task_id]["result"] == {"items": 3}
+
+        # 批次查詢的項目與單一任務查詢的格式一致
+        single = client.get(f"/api/v1/tasks/{third.task_id}").json()["data"]
+        assert tasks[third.task_id] == single
@@ -1,6 +1,5 @@
 """Streamlit main application - 使用 /api/v1/process 單一 API 端點."""
 
-import os
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -11,6 +10,7 @@ load_dotenv(dotenv_path=env_path)
 import streamlit as st
 import pandas as pd
 from styles import apply_poc_styles
+from utils import get_cached_api_client
 
 
 # Page configuration
@@ -28,28 +28,23 @@ apply_poc_styles()
 def init_session_state():
     """Initialize session state variables."""
     # API Client
-    if "api_client" not in st.session_state:
-        from services.api_client import APIClient
-        backend_host = os.getenv("BACKEND_HOST", "localhost")
-        backend_port = os.getenv("BACKEND_PORT", "8000")
-        api_key = os.getenv("API_KEY", "")
-        base_url = f"http://{backend_host}:{backend_port}"
-        st.session_state.api_client = APIClient(base_url=base_url, api_key=api_key)
+    if st.session_state.get("api_client") is None:
+        st.session_state.api_client = get_cached_api_client()
 
     # Workflow step: upload or results
-    if "step" not in st.session_state:
-        st.session_state["step"] = "upload"
+    st.session_state.setdefault("step", "upload")
 
     # Processing results
-    if "parsed_items" not in st.session_state:
-        st.session_state["parsed_items"] = None
+    st.session_state.setdefault("parsed_items", None)
 
 
 def get_api_client():
     """Get API client from session state."""
-    if "api_client" not in st.session_state:
+    client = st.session_state.get("api_client")
+    if client is None:
         init_session_state()
-    return st.session_state.api_client
+        client = st.session_state.api_client
+    return client
 
 
 # Initialize session state at module level
@@ -1,7 +1,6 @@
 """Progress display component."""
 
 import streamlit as st
-import time
 from typing import Optional
 
 
@@ -82,6 +81,9 @@ def wait_for_task_completion(
     """
     Wait for task completion with progress display.
 
+    透過 client.wait_for_completion 等待（SSE 優先，退回退避輪詢），
+    每次狀態更新時刷新 placeholder。
+
     Args:
         client: API client
         task_id: Task ID to wait for
@@ -92,39 +94,26 @@ def wait_for_task_completion(
     Returns:
         Final task status or None if timeout
     """
-    import asyncio
-
-    elapsed = 0
-    last_progress = 0
-
-    while elapsed < max_wait:
-        try:
-            # Get task status
-            async def check_status():
-                return await client.get_task_status(task_id)
-
-            status_response = asyncio.run(check_status())
-            task = status_response.get("data", {})
-
-            # Update progress
-            if placeholder:
-                with placeholder.container():
-                    display_task_status(task)
-
-            # Check if completed
-            if task.get("status") in ["completed", "failed"]:
-                return task
-
-            # Wait before next poll
-            time.sleep(poll_interval)
-            elapsed += poll_interval
-
-        except Exception as e:
-            st.error(f"無法取得任務狀態：{e}")
-            return None
 
-    st.error(f"⏱️ 任務超時（超過 {max_wait} 秒）")
-    return None
+    def show(task: dict) -> None:
+        with placeholder.container():
+            display_task_status(task)
+
+    try:
+        status_response = client.wait_for_completion(
+            task_id,
+            max_wait,
+            poll_interval,
+            on_update=show if placeholder else None,
+        )
+        return status_response.get("data", {})
+
+    except TimeoutError:
+        st.error(f"⏱️ 任務超時（超過 {max_wait} 秒）")
+        return None
+    except Exception as e:
+        st.error(f"無法取得任務狀態：{e}")
+        return None
 
 
 def display_completion_status(task: dict) -> None:
@@ -1,54 +1,314 @@
 """API client for communicating with FastAPI backend."""
 
+import atexit
+import functools
 import httpx
-import json
+import io
 import logging
+import orjson
 import os
+import random
+import threading
 import time
-from typing import Dict, Any, List, Callable, Optional
+from collections import OrderedDict
+from contextlib import ExitStack
+from typing import Dict, Any, BinaryIO, Iterator, List, Callable, Optional
 from pathlib import Path
 
 
 logger = logging.getLogger(__name__)
 
 
-class APIClient:
-    """Synchronous client for interacting with the backend API."""
+def _log_errors(
+    message: str, quiet: tuple[type[Exception], ...] = ()
+) -> Callable:
+    """
+    Log failures of an APIClient call once at the call boundary, then re-raise.
+
+    Args:
+        message: Log message prefix (e.g. "Failed to get task status")
+        quiet: Exception types re-raised without logging (e.g. TimeoutError,
+            which callers handle as an expected outcome)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except quiet:
+                raise
+            except Exception as e:
+                logger.error("%s: %s", message, e)
+                raise
 
-    def __init__(self, base_url: str = "http://localhost:8000", api_key: str | None = None):
+        return wrapper
+
+    return decorator
+
+
+# 連線池設定：同一主機的輪詢共用 keep-alive 連線，閒置 60 秒內不重新握手
+POOL_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0,
+)
+# 增加 timeout 以支援長時間處理；連線逾時則快速失敗
+REQUEST_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+# 大型 JSON 回應壓縮傳輸（br 需安裝 brotli）
+DEFAULT_HEADERS = {"Accept-Encoding": "br, gzip"}
+# 連線失敗時由 transport 自動重試的次數
+CONNECT_RETRIES = 3
+
+# 條件式 GET 快取的項目上限：解析結果含每個項目的 photo_base64，且 client 由所有
+# session 共用，超過上限時淘汰最久未使用的項目
+ETAG_CACHE_MAXSIZE = 32
+
+# health_check 結果快取秒數：頁面每次 rerun 都會檢查，後端狀態以秒為單位變化
+HEALTH_CACHE_TTL = 5.0
+
+# 輪詢退避：首次等待 0.2 秒，每次乘以 1.6，上限為呼叫端的 poll_interval，並加上最多 10% 抖動
+POLL_INITIAL_DELAY = 0.2
+POLL_BACKOFF_FACTOR = 1.6
+POLL_JITTER = 0.1
+
+# orjson 編碼的請求主體所使用的標頭
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# 含 ID 的 API 路徑樣板（相對於 client 的 base_url），以 % 格式化
+_TASK_PATH = "/tasks/%s"
+_TASK_EVENTS_PATH = "/tasks/%s/events"
+_DOCUMENT_PATH = "/documents/%s"
+_DOCUMENT_PARSING_PATH = "/documents/%s/parsing"
+_PARSE_RESULT_PATH = "/documents/%s/parse-result"
+_QUOTATION_EXCEL_PATH = "/quotations/%s/excel"
+
+# 冪等 GET 遇到暫時性錯誤時重試的 HTTP 狀態碼
+RETRYABLE_STATUS_CODES = (502, 503, 504)
+# 冪等 GET 重試的連線層錯誤：連線建立失敗已由 transport 重試（CONNECT_RETRIES），
+# 逾時不重試，以免單一卡住的請求以 600 秒讀取逾時重複等待並超出呼叫端的期限
+RETRYABLE_TRANSPORT_ERRORS = (httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError)
+
+
+def _retry_transient(
+    attempts: int = 3, base_delay: float = 0.5, max_delay: float = 5.0
+) -> Callable:
+    """
+    Retry an idempotent GET call on transient failures with exponential backoff.
+
+    重試 RETRYABLE_TRANSPORT_ERRORS 與 502/503/504；逾時直接拋出。只用於 GET，
+    upload_files、create_quotation 等非冪等操作不可套用。
+
+    Args:
+        attempts: Total number of attempts
+        base_delay: Delay before the first retry in seconds (doubles each retry)
+        max_delay: Upper bound for a single delay in seconds
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            delay = base_delay
+            for attempt in range(1, attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code not in RETRYABLE_STATUS_CODES or attempt == attempts:
+                        raise
+                except RETRYABLE_TRANSPORT_ERRORS:
+                    if attempt == attempts:
+                        raise
+                time.sleep(delay)
+                delay = min(delay * 2, max_delay)
+
+        return wrapper
+
+    return decorator
+
+
+class APIClient:
+    """Synchronous client for interacting with the backend API.
+
+    Prefer get_client() over constructing this class directly so connection
+    pools are shared across Streamlit reruns.
+    """
+
+    __slots__ = (
+        "base_url",
+        "api",
+        "api_key",
+        "client",
+        "_etag_cache",
+        "_etag_lock",
+        "_health_cache",
+    )
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        api_key: str | None = None,
+        api_prefix: str = "/api/v1",
+    ):
         """
         Initialize API client.
 
         Args:
             base_url: Backend API base URL
             api_key: API key for authentication (optional, reads from env if not provided)
+            api_prefix: API route prefix (use "/api" for older backends)
         """
         self.base_url = base_url.rstrip("/")
+        self.api = api_prefix.rstrip("/")
         self.api_key = api_key or os.getenv("API_KEY", "")
-        self.client = httpx.Client(timeout=600)  # 增加 timeout 以支援長時間處理
+        # 所有請求使用相對路徑，由 base_url 定位；同一主機的輪詢共用 keep-alive 連線
+        self.client = httpx.Client(
+            base_url=self.base_url + self.api,
+            transport=httpx.HTTPTransport(
+                retries=CONNECT_RETRIES, http2=True, limits=POOL_LIMITS
+            ),
+            timeout=REQUEST_TIMEOUT,
+            headers=DEFAULT_HEADERS,
+        )
+        # 條件式 GET 快取（LRU）：URL -> (ETag, 已解析的 JSON)
+        self._etag_cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        # 共用 client 由多個 session 執行緒同時使用，快取的讀寫需加鎖
+        self._etag_lock = threading.Lock()
+        # health_check 結果快取：(到期時間, 回應)
+        self._health_cache: tuple[float, Dict[str, Any]] | None = None
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """
+        Close the HTTP client.
+
+        透過 get_client() 取得的共用 client 由 atexit 於程序結束時關閉，
+        頁面程式碼不應呼叫 close()，否則其他 session 會拿到已關閉的連線池。
+        """
         self.client.close()
 
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # 未明確關閉的 client 在回收時釋放連線池；直譯器關閉期間可能已無法呼叫
+        try:
+            if not self.client.is_closed:
+                self.client.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _json(response: httpx.Response) -> Any:
+        """Decode a JSON response body with orjson (bytes → objects, no str copy)."""
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _build_file_list(
+        files: List[tuple[str, bytes]] | List[Path],
+        stack: ExitStack,
+    ) -> List[tuple[str, tuple[str, BinaryIO, str]]]:
+        """
+        Build multipart "files" fields for upload as file objects.
+
+        Path 項目以檔案物件傳入（由 stack 負責關閉），httpx 會分塊讀取並
+        以 os.fstat 設定 Content-Length，不需先將整個 PDF 讀入記憶體；
+        bytes 內容包成 BytesIO 走相同的串流路徑。
+        """
+        file_list = []
+        for item in files:
+            if isinstance(item, Path):
+                # Handle Path objects
+                f = stack.enter_context(open(item, "rb"))
+                file_list.append(("files", (item.name, f, "application/pdf")))
+            else:
+                # Handle (filename, content) tuples
+                filename, content = item
+                file_list.append(("files", (filename, io.BytesIO(content), "application/pdf")))
+        return file_list
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_body: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Send a request, raise on HTTP errors and return decoded JSON.
+
+        json_body 以 orjson 編碼為請求主體，取代 httpx 的 json= 標準庫編碼。
+        """
+        if json_body is not None:
+            kwargs["content"] = orjson.dumps(json_body)
+            kwargs["headers"] = {**_JSON_HEADERS, **kwargs.get("headers", {})}
+        response = self.client.request(method, url, **kwargs)
+        response.raise_for_status()
+        return self._json(response)
+
+    def _get_cached(self, url: str, params: Dict[str, Any] | None = None) -> Any:
+        """
+        GET with ETag / If-None-Match revalidation.
+
+        後端回應 304 Not Modified 時直接返回上次解析的結果（回傳同一物件，
+        呼叫端不應就地修改）；回應未帶 ETag 時與一般 GET 相同。
+        快取最多保留 ETAG_CACHE_MAXSIZE 個 URL。
+        """
+        key = str(httpx.URL(url, params=params))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = self.client.get(url, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            # 請求期間其他 session 可能已將此項目淘汰，以本地副本重新放入
+            self._remember_etag(key, cached)
+            return cached[1]
+
+        response.raise_for_status()
+        data = self._json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._remember_etag(key, (etag, data))
+        return data
+
+    def _remember_etag(self, key: str, entry: tuple[str, Any]) -> None:
+        """Store a conditional-GET cache entry as most recently used, evicting the oldest."""
+        with self._etag_lock:
+            self._etag_cache[key] = entry
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                self._etag_cache.popitem(last=False)
+
+    @_log_errors("Health check failed")
     def health_check(self) -> Dict[str, Any]:
         """
         Check backend health.
 
+        成功的結果快取 HEALTH_CACHE_TTL 秒，期間內重複呼叫不發出請求；
+        需要即時結果時先呼叫 invalidate_health()。
+
         Returns:
             Health check response
 
         Raises:
             httpx.HTTPError: If request fails
         """
-        try:
-            response = self.client.get(f"{self.base_url}/api/v1/health")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            raise
-
+        now = time.monotonic()
+        cached = self._health_cache
+        if cached and cached[0] > now:
+            return cached[1]
+        result = self._request("GET", "/health")
+        self._health_cache = (now + HEALTH_CACHE_TTL, result)
+        return result
+
+    def invalidate_health(self) -> None:
+        """Drop the cached health_check result so the next call hits the backend."""
+        self._health_cache = None
+
+    @_log_errors("File upload failed")
     def upload_files(
         self,
         files: List[tuple[str, bytes]] | List[Path],
@@ -79,31 +339,16 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        try:
-            file_list = []
-
-            for item in files:
-                if isinstance(item, Path):
-                    # Handle Path objects
-                    with open(item, "rb") as f:
-                        content = f.read()
-                    file_list.append(("files", (item.name, content, "application/pdf")))
-                else:
-                    # Handle (filename, content) tuples
-                    filename, content = item
-                    file_list.append(("files", (filename, content, "application/pdf")))
-
-            response = self.client.post(
-                f"{self.base_url}/api/v1/documents",
-                files=file_list,
+        with ExitStack() as stack:
+            return self._request(
+                "POST",
+                "/documents",
+                files=self._build_file_list(files, stack),
                 params={"extract_images": extract_images},
             )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"File upload failed: {e}")
-            raise
 
+    @_log_errors("Failed to get task status")
+    @_retry_transient()
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
         Get processing task status.
@@ -117,24 +362,56 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        try:
-            response = self.client.get(f"{self.base_url}/api/v1/tasks/{task_id}")
+        return self._request("GET", _TASK_PATH % task_id)
+
+    def stream_task_events(
+        self, task_id: str, timeout: float | None = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Subscribe to task status events via Server-Sent Events.
+
+        後端在任務狀態、進度或訊息變化時推送事件，任務結束後關閉串流，
+        取代 get_task_status 的定時輪詢。
+
+        Args:
+            task_id: Task ID to subscribe to
+            timeout: Read timeout in seconds between events (defaults to client timeout)
+
+        Yields:
+            Task status dicts (same shape as get_task_status()["data"])
+
+        Raises:
+            httpx.HTTPError: If request fails (404/405 when backend lacks the endpoint)
+        """
+        with self.client.stream(
+            "GET",
+            _TASK_EVENTS_PATH % task_id,
+            headers={"Accept": "text/event-stream"},
+            timeout=timeout if timeout is not None else self.client.timeout,
+        ) as response:
             response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to get task status: {e}")
-            raise
+            for line in response.iter_lines():
+                if line.startswith("data:"):
+                    yield orjson.loads(line[5:])
 
+    @_log_errors("Error while waiting for task", quiet=(TimeoutError,))
     def wait_for_completion(
-        self, task_id: str, max_wait: int = 300, poll_interval: int = 2
+        self,
+        task_id: str,
+        max_wait: int = 300,
+        poll_interval: int = 2,
+        on_update: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """
         Wait for task to complete.
 
+        優先使用 SSE 訂閱任務事件；後端不支援時（404/405）退回輪詢。
+
         Args:
             task_id: Task ID to wait for
             max_wait: Maximum wait time in seconds
-            poll_interval: Poll interval in seconds
+            poll_interval: Poll interval in seconds (polling fallback only)
+            on_update: Called with the task status data on every update (optional)
 
         Returns:
             Final task status
@@ -143,20 +420,196 @@ class APIClient:
             TimeoutError: If task takes too long
             httpx.HTTPError: If request fails
         """
-        elapsed = 0
-        while elapsed < max_wait:
-            try:
-                status = self.get_task_status(task_id)
-                if status.get("data", {}).get("status") in ["completed", "failed"]:
-                    return status
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-            except Exception as e:
-                logger.error(f"Error while waiting for task: {e}")
+        deadline = time.monotonic() + max_wait
+
+        task = self._wait_task_events(task_id, deadline, on_update)
+        if task is not None:
+            return {
+                "success": True,
+                "message": f"任務狀態：{task['status']}",
+                "data": task,
+            }
+
+        # 後端不支援 SSE 或串流提前結束，改以輪詢取得最終狀態
+        status = self._poll_task_status(task_id, deadline, poll_interval, on_update)
+        if status is None:
+            raise TimeoutError(f"Task {task_id} did not complete within {max_wait} seconds")
+        return status
+
+    def _wait_task_events(
+        self,
+        task_id: str,
+        deadline: float,
+        on_update: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait over SSE until the task reaches completed/failed.
+
+        on_update（若有）於每個狀態事件時以任務資料呼叫。
+
+        Returns:
+            Final task status data, or None when the events endpoint is
+            unavailable (404/405), the stream ends early, or the deadline passes
+        """
+        try:
+            timeout = max(deadline - time.monotonic(), 0.001)
+            for task in self.stream_task_events(task_id, timeout=timeout):
+                if on_update:
+                    on_update(task)
+                if task.get("status") in ["completed", "failed"]:
+                    return task
+                if time.monotonic() >= deadline:
+                    return None
+        except httpx.ReadTimeout:
+            return None
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in (404, 405):
                 raise
+            logger.debug("Task events stream unavailable, falling back to polling")
+
+        return None
+
+    def _poll_task_status(
+        self,
+        task_id: str,
+        deadline: float,
+        poll_interval: int,
+        on_update: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Poll get_task_status until the task finishes or the monotonic deadline passes."""
+
+        def fetch() -> Dict[str, Any]:
+            status = self.get_task_status(task_id)
+            if on_update:
+                on_update(status.get("data", {}))
+            return status
+
+        return self._poll(
+            fetch,
+            lambda status: status.get("data", {}).get("status") in ["completed", "failed"],
+            deadline,
+            poll_interval,
+        )
+
+    @staticmethod
+    def _backoff_sleep(delay: float, deadline: float, poll_interval: float) -> float:
+        """
+        Sleep for delay (plus jitter, clipped to the deadline) and return the next delay.
+
+        延遲以 POLL_BACKOFF_FACTOR 倍數成長至 poll_interval；抖動避免多個
+        client 同步輪詢造成請求尖峰。
+        """
+        remaining = deadline - time.monotonic()
+        time.sleep(min(delay + random.uniform(0, delay * POLL_JITTER), max(0, remaining)))
+        return min(delay * POLL_BACKOFF_FACTOR, poll_interval)
+
+    def _poll(
+        self,
+        fn: Callable[[], Any],
+        is_done: Callable[[Any], bool],
+        deadline: float,
+        poll_interval: float,
+    ) -> Any:
+        """
+        Call fn until is_done(result), backing off exponentially between calls.
+
+        Returns:
+            The first result accepted by is_done, or None if the deadline passes
+        """
+        delay = min(POLL_INITIAL_DELAY, poll_interval)
+        while time.monotonic() < deadline:
+            result = fn()
+            if is_done(result):
+                return result
+            delay = self._backoff_sleep(delay, deadline, poll_interval)
+
+        return None
+
+    @_log_errors("Failed to get tasks status")
+    def get_tasks_status(self, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get status of several tasks with a single request.
+
+        使用 GET /tasks?ids=a,b,c 批次查詢；若後端不支援 ids 參數（404 或
+        回應中缺少部分任務），缺漏的任務改以 get_task_status 逐一查詢。
+
+        Args:
+            task_ids: Task IDs to check
 
-        raise TimeoutError(f"Task {task_id} did not complete within {max_wait} seconds")
+        Returns:
+            Mapping of task_id to task status data
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        response = self.client.get(
+            "/tasks",
+            params={"ids": ",".join(task_ids)},
+        )
+        if response.status_code == 404:
+            tasks = {}
+        else:
+            response.raise_for_status()
+            tasks = {
+                t["task_id"]: t
+                for t in self._json(response).get("data", {}).get("tasks", [])
+            }
 
+        for task_id in task_ids:
+            if task_id not in tasks:
+                tasks[task_id] = self.get_task_status(task_id).get("data", {})
+
+        return {task_id: tasks[task_id] for task_id in task_ids}
+
+    def wait_for_all(
+        self,
+        task_ids: List[str],
+        max_wait: int = 300,
+        poll_interval: int = 2,
+        on_update: Optional[Callable[[Dict[str, Dict[str, Any]]], None]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several tasks to complete, polling them in one batch per tick.
+
+        Args:
+            task_ids: Task IDs to wait for
+            max_wait: Maximum wait time in seconds
+            poll_interval: Poll interval in seconds
+            on_update: Called with the latest status data of every task
+                (task_id → data) after each poll (optional)
+
+        Returns:
+            Mapping of task_id to final task status data
+
+        Raises:
+            TimeoutError: If any task takes too long
+            httpx.HTTPError: If request fails
+        """
+        pending = list(task_ids)
+        finished: Dict[str, Dict[str, Any]] = {}
+        latest: Dict[str, Dict[str, Any]] = {}
+
+        def check() -> bool:
+            nonlocal pending
+            for task_id, task in self.get_tasks_status(pending).items():
+                latest[task_id] = task
+                if task.get("status") in ["completed", "failed"]:
+                    finished[task_id] = task
+            pending = [task_id for task_id in pending if task_id not in finished]
+            if on_update:
+                on_update({task_id: latest[task_id] for task_id in task_ids})
+            return not pending
+
+        deadline = time.monotonic() + max_wait
+        if self._poll(check, bool, deadline, poll_interval):
+            return {task_id: finished[task_id] for task_id in task_ids}
+
+        raise TimeoutError(
+            f"Tasks {', '.join(pending)} did not complete within {max_wait} seconds"
+        )
+
+    @_log_errors("Failed to list documents")
+    @_retry_transient()
     def list_documents(self) -> Dict[str, Any]:
         """
         List all uploaded documents.
@@ -167,14 +620,10 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        try:
-            response = self.client.get(f"{self.base_url}/api/v1/documents")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to list documents: {e}")
-            raise
+        return self._get_cached("/documents")
 
+    @_log_errors("Failed to get document")
+    @_retry_transient()
     def get_document(self, document_id: str) -> Dict[str, Any]:
         """
         Get document details.
@@ -188,14 +637,9 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        try:
-            response = self.client.get(f"{self.base_url}/api/v1/documents/{document_id}")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to get document: {e}")
-            raise
+        return self._get_cached(_DOCUMENT_PATH % document_id)
 
+    @_log_errors("Failed to start parsing")
     def parse_document(
         self, document_id: str, extract_images: bool = True
     ) -> Dict[str, Any]:
@@ -212,17 +656,14 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        try:
-            response = self.client.post(
-                f"{self.base_url}/api/v1/documents/{document_id}/parsing",
-                json={"extract_images": extract_images},
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to start parsing: {e}")
-            raise
-
+        return self._request(
+            "POST",
+            _DOCUMENT_PARSING_PATH % document_id,
+            json_body={"extract_images": extract_images},
+        )
+
+    @_log_errors("Failed to get parse result")
+    @_retry_transient()
     def get_parse_result(self, document_id: str) -> Dict[str, Any]:
         """
         Get parsing result for a document.
@@ -236,16 +677,10 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        try:
-            response = self.client.get(
-                f"{self.base_url}/api/v1/documents/{document_id}/parse-result"
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to get parse result: {e}")
-            raise
+        # 結果未變更時後端回 304，直接沿用上次解析的 BOQ 資料
+        return self._get_cached(_PARSE_RESULT_PATH % document_id)
 
+    @_log_errors("Failed to create quotation")
     def create_quotation(self, document_ids: List[str]) -> Dict[str, Any]:
         """
         Create quotation from documents (simple merge without quantity summary).
@@ -259,17 +694,13 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        try:
-            response = self.client.post(
-                f"{self.base_url}/api/v1/quotations",
-                json={"document_ids": document_ids},
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to create quotation: {e}")
-            raise
+        return self._request(
+            "POST",
+            "/quotations",
+            json_body={"document_ids": document_ids},
+        )
 
+    @_log_errors("Failed to create merged quotation", quiet=(TimeoutError,))
     def create_merged_quotation(
         self,
         document_ids: List[str],
@@ -298,52 +729,47 @@ class APIClient:
             httpx.HTTPError: If request fails
             TimeoutError: If merge takes too long
         """
-        try:
-            # Start merge
-            payload = {"document_ids": document_ids}
-            if title:
-                payload["title"] = title
-
-            response = self.client.post(
-                f"{self.base_url}/api/v1/quotations/merge",
-                json=payload,
-            )
-            response.raise_for_status()
-            result = response.json()
-
-            # If merge is async (202), wait for completion
-            if response.status_code == 202:
-                task_id = result.get("data", {}).get("task_id")
-                quotation_id = result.get("data", {}).get("quotation_id")
-
-                if task_id:
-                    # Wait for task completion
-                    task_result = self.wait_for_completion(task_id, max_wait, poll_interval)
-                    task_status = task_result.get("data", {}).get("status")
-
-                    if task_status == "completed":
-                        # Return quotation info
-                        return {
-                            "success": True,
-                            "message": "跨表合併完成",
-                            "data": {"id": quotation_id},
-                        }
-                    else:
-                        error = task_result.get("data", {}).get("error", "合併失敗")
-                        return {
-                            "success": False,
-                            "message": error,
-                            "data": None,
-                        }
-
-            return result
-
-        except TimeoutError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to create merged quotation: {e}")
-            raise
+        # Start merge
+        payload = {"document_ids": document_ids}
+        if title:
+            payload["title"] = title
+
+        response = self.client.post(
+            "/quotations/merge",
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
+        result = self._json(response)
+
+        # If merge is async (202), wait for completion
+        if response.status_code == 202:
+            task_id = result.get("data", {}).get("task_id")
+            quotation_id = result.get("data", {}).get("quotation_id")
+
+            if task_id:
+                # Wait for task completion
+                task_result = self.wait_for_completion(task_id, max_wait, poll_interval)
+                task_status = task_result.get("data", {}).get("status")
+
+                if task_status == "completed":
+                    # Return quotation info
+                    return {
+                        "success": True,
+                        "message": "跨表合併完成",
+                        "data": {"id": quotation_id},
+                    }
+                else:
+                    error = task_result.get("data", {}).get("error", "合併失敗")
+                    return {
+                        "success": False,
+                        "message": error,
+                        "data": None,
+                    }
+
+        return result
 
+    @_log_errors("Failed to get quotation Excel", quiet=(TimeoutError,))
     def get_quotation_excel(
         self,
         quotation_id: str,
@@ -351,12 +777,15 @@ class APIClient:
         photo_height_cm: float = 3.0,
         max_wait: int = 300,
         poll_interval: int = 2,
-    ) -> bytes:
+        out_path: Path | None = None,
+    ) -> bytes | Path:
         """
         Get quotation Excel file with automatic polling.
 
         This method handles both immediate download (if Excel is ready) and
         automatic polling (if Excel generation is in progress).
+        指定 out_path 時以串流分塊寫入檔案，記憶體用量固定，
+        不需將整個 .xlsx（含照片可達數 MB）載入為 bytes。
 
         Args:
             quotation_id: Quotation ID to export
@@ -364,50 +793,148 @@ class APIClient:
             photo_height_cm: Photo height in centimeters
             max_wait: Maximum wait time in seconds for generation
             poll_interval: Poll interval in seconds when waiting
+            out_path: Destination file path (optional)
 
         Returns:
-            Excel file content as bytes
+            Excel file content as bytes, or out_path when given
 
         Raises:
             TimeoutError: If generation takes too long
+            RuntimeError: If the Excel generation task fails
             httpx.HTTPError: If request fails
         """
+        chunks = self._iter_quotation_excel(
+            quotation_id, include_photos, photo_height_cm, max_wait, poll_interval
+        )
+        if out_path is None:
+            return b"".join(chunks)
+
+        dest = Path(out_path)
+        part = dest.with_name(dest.name + ".part")
         try:
-            params = {
-                "include_photos": include_photos,
-                "photo_height_cm": photo_height_cm,
-            }
+            with open(part, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            part.replace(dest)
+            return dest
+        except Exception:
+            # 不留下寫到一半的檔案
+            part.unlink(missing_ok=True)
+            raise
 
-            elapsed = 0
-            while elapsed < max_wait:
-                response = self.client.get(
-                    f"{self.base_url}/api/v1/quotations/{quotation_id}/excel",
-                    params=params,
-                )
+    def download_quotation_excel(
+        self,
+        quotation_id: str,
+        dest: Path,
+        include_photos: bool = True,
+        photo_height_cm: float = 3.0,
+        max_wait: int = 300,
+        poll_interval: int = 2,
+    ) -> Path:
+        """
+        Download quotation Excel file straight to disk.
 
-                # If ready, return the Excel file
-                if response.status_code == 200:
-                    return response.content
+        等同 get_quotation_excel(..., out_path=dest)。
 
-                # If still generating, wait and retry
-                if response.status_code == 202:
-                    time.sleep(poll_interval)
-                    elapsed += poll_interval
-                    continue
+        Args:
+            quotation_id: Quotation ID to export
+            dest: Destination file path
+            include_photos: Whether to include photos in Excel
+            photo_height_cm: Photo height in centimeters
+            max_wait: Maximum wait time in seconds for generation
+            poll_interval: Poll interval in seconds when waiting
 
-                # Other status codes
-                response.raise_for_status()
+        Returns:
+            Destination path
 
-            raise TimeoutError(
-                f"Excel generation for quotation {quotation_id} did not complete within {max_wait} seconds"
-            )
+        Raises:
+            TimeoutError: If generation takes too long
+            RuntimeError: If the Excel generation task fails
+            httpx.HTTPError: If request fails
+        """
+        return self.get_quotation_excel(
+            quotation_id,
+            include_photos,
+            photo_height_cm,
+            max_wait,
+            poll_interval,
+            out_path=dest,
+        )
+
+    def _iter_quotation_excel(
+        self,
+        quotation_id: str,
+        include_photos: bool,
+        photo_height_cm: float,
+        max_wait: int,
+        poll_interval: int,
+        chunk_size: int = 1 << 20,
+    ) -> Iterator[bytes]:
+        """
+        Poll the Excel endpoint until ready (202 → 200), then yield the file in chunks.
 
-        except TimeoutError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to get quotation Excel: {e}")
-            raise
+        第一次 GET 觸發產出後，優先以 SSE 訂閱產出任務事件；無法訂閱時
+        改以 HEAD 探測就緒狀態，檔案就緒才發出一次 GET 下載；後端不支援
+        HEAD（405）時退回以 GET 輪詢。
+        """
+        params = {
+            "include_photos": include_photos,
+            "photo_height_cm": photo_height_cm,
+        }
+
+        url = _QUOTATION_EXCEL_PATH % quotation_id
+
+        deadline = time.monotonic() + max_wait
+        delay = min(POLL_INITIAL_DELAY, poll_interval)
+        probe_with_head = False
+        head_supported = True
+        while time.monotonic() < deadline:
+            if probe_with_head:
+                status_code = self.client.head(url, params=params).status_code
+                if status_code == 202:
+                    delay = self._backoff_sleep(delay, deadline, poll_interval)
+                    continue
+                # 200：檔案就緒；404：需重新觸發產出；405：後端不支援 HEAD
+                head_supported = status_code != 405
+
+            with self.client.stream("GET", url, params=params) as response:
+                # If ready, stream the Excel file
+                if response.status_code == 200:
+                    yield from response.iter_bytes(chunk_size)
+                    return
 
+                # Read the small status body so the connection returns to the pool
+                response.read()
+
+                # Other status codes
+                if response.status_code != 202:
+                    response.raise_for_status()
+
+                task_id = (self._json(response).get("data") or {}).get("task_id")
+
+            # 剛觸發產出時回應帶有 task_id：透過 SSE 等待產出任務結束
+            task = self._wait_task_events(task_id, deadline) if task_id else None
+            if task is not None:
+                if task.get("status") == "failed":
+                    # 再次 GET 會重新觸發產出，直接回報失敗原因
+                    raise RuntimeError(
+                        f"Excel generation for quotation {quotation_id} failed: "
+                        f"{task.get('error') or 'unknown error'}"
+                    )
+                # 產出完成，直接 GET 下載
+                probe_with_head = False
+                continue
+
+            # If still generating, wait and retry
+            probe_with_head = head_supported
+            delay = self._backoff_sleep(delay, deadline, poll_interval)
+
+        raise TimeoutError(
+            f"Excel generation for quotation {quotation_id} did not complete within {max_wait} seconds"
+        )
+
+    @_log_errors("Failed to list tasks")
+    @_retry_transient()
     def list_tasks(
         self, limit: int = 20, status: str | None = None
     ) -> Dict[str, Any]:
@@ -424,20 +951,11 @@ class APIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        try:
-            params = {"limit": limit}
-            if status is not None:
-                params["status"] = status
+        params = {"limit": limit}
+        if status is not None:
+            params["status"] = status
 
-            response = self.client.get(
-                f"{self.base_url}/api/v1/tasks",
-                params=params,
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to list tasks: {e}")
-            raise
+        return self._get_cached("/tasks", params=params)
 
     def process_files(
         self,
@@ -484,31 +1002,21 @@ class APIClient:
             httpx.HTTPError: If request fails
         """
         try:
-            file_list = []
-
-            for item in files:
-                if isinstance(item, Path):
-                    with open(item, "rb") as f:
-                        content = f.read()
-                    file_list.append(("files", (item.name, content, "application/pdf")))
-                else:
-                    filename, content = item
-                    file_list.append(("files", (filename, content, "application/pdf")))
-
             headers = {}
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
 
-            response = self.client.post(
-                f"{self.base_url}/api/v1/process",
-                files=file_list,
-                params={"extract_images": extract_images},
-                headers=headers,
-            )
+            with ExitStack() as stack:
+                response = self.client.post(
+                    "/process",
+                    files=self._build_file_list(files, stack),
+                    params={"extract_images": extract_images},
+                    headers=headers,
+                )
             response.raise_for_status()
 
             # API 返回 {project_name, items} 結構
-            result = response.json()
+            result = self._json(response)
             items = result.get("items", [])
             project_name = result.get("project_name")
             return {
@@ -520,18 +1028,18 @@ class APIClient:
         except httpx.HTTPStatusError as e:
             error_detail = ""
             try:
-                error_json = e.response.json()
+                error_json = self._json(e.response)
                 error_detail = error_json.get("message", str(e))
             except Exception:
                 error_detail = str(e)
-            logger.error(f"Process files failed: {error_detail}")
+            logger.error("Process files failed: %s", error_detail)
             return {
                 "success": False,
                 "data": None,
                 "message": error_detail,
             }
         except Exception as e:
-            logger.error(f"Process files failed: {e}")
+            logger.error("Process files failed: %s", e)
             return {
                 "success": False,
                 "data": None,
@@ -600,26 +1108,15 @@ class APIClient:
             ```
         """
         try:
-            file_list = []
-
-            for item in files:
-                if isinstance(item, Path):
-                    with open(item, "rb") as f:
-                        content = f.read()
-                    file_list.append(("files", (item.name, content, "application/pdf")))
-                else:
-                    filename, content = item
-                    file_list.append(("files", (filename, content, "application/pdf")))
-
             headers = {}
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
 
-            # 使用 stream 參數以支援 SSE
-            with self.client.stream(
+            # 使用 stream 參數以支援 SSE；上傳檔案在串流結束時關閉
+            with ExitStack() as stack, self.client.stream(
                 "POST",
-                f"{self.base_url}/api/v1/process/stream",
-                files=file_list,
+                "/process/stream",
+                files=self._build_file_list(files, stack),
                 params={"extract_images": extract_images},
                 headers=headers,
             ) as response:
@@ -641,9 +1138,9 @@ class APIClient:
                     elif line.startswith("data:") and event_type:
                         data_str = line.split(":", 1)[1].strip()
                         try:
-                            data = json.loads(data_str)
-                        except json.JSONDecodeError:
-                            logger.warning(f"Invalid JSON in SSE data: {data_str}")
+                            data = orjson.loads(data_str)
+                        except orjson.JSONDecodeError:
+                            logger.warning("Invalid JSON in SSE data: %s", data_str)
                             continue
 
                         # 根據事件類型處理
@@ -684,11 +1181,11 @@ class APIClient:
         except httpx.HTTPStatusError as e:
             error_detail = ""
             try:
-                error_json = e.response.json()
+                error_json = self._json(e.response)
                 error_detail = error_json.get("message", str(e))
             except Exception:
                 error_detail = str(e)
-            logger.error(f"Process files stream failed: {error_detail}")
+            logger.error("Process files stream failed: %s", error_detail)
             if on_error:
                 on_error({"code": "HTTP_ERROR", "message": error_detail})
             return {
@@ -697,7 +1194,7 @@ class APIClient:
                 "message": error_detail,
             }
         except Exception as e:
-            logger.error(f"Process files stream failed: {e}")
+            logger.error("Process files stream failed: %s", e)
             if on_error:
                 on_error({"code": "UNKNOWN_ERROR", "message": str(e)})
             return {
@@ -705,3 +1202,28 @@ class APIClient:
                 "data": None,
                 "message": str(e),
             }
+
+
+@functools.cache
+def get_client(
+    base_url: str = "http://localhost:8000", api_key: str | None = None
+) -> APIClient:
+    """
+    取得共用的 APIClient（每組 base_url/api_key 一個實例）。
+
+    同一程序內的所有 Streamlit session 共用同一個 httpx 連線池，
+    避免每次 rerun 重建 client 而失去 keep-alive 與 TLS 連線。
+    應用程式程式碼應透過此函數取得 client，不再直接建構 APIClient()。
+    快取不設上限也不淘汰：鍵為部署設定，實例數量固定，且 atexit 持有
+    每個實例，淘汰只會留下無法回收的連線池。
+
+    Args:
+        base_url: Backend API base URL
+        api_key: API key for authentication (optional, reads from env if not provided)
+
+    Returns:
+        共用的 APIClient 實例（程序結束時自動關閉）
+    """
+    client = APIClient(base_url=base_url, api_key=api_key)
+    atexit.register(client.close)
+    return client
@@ -1,238 +1,49 @@
 """Simple CSS styles for POC - minimal branding."""
 
+import re
+from pathlib import Path
+
 import streamlit as st
 
+# 樣式表放在 static/ 下，與 Python 程式碼分開維護
+POC_CSS_PATH = Path(__file__).parent / "static" / "poc.css"
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};,>])\s*")
+_CSS_COLON_SPACE_RE = re.compile(r":\s+")
+
+
+def _minify_css(css: str) -> str:
+    """簡易 CSS 壓縮：移除註解並收合空白（樣式表中不含需保留空白的選擇器）。"""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_SPACE_RE.sub(r"\1", css)
+    css = _CSS_COLON_SPACE_RE.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+# 匯入時讀取並壓縮一次，之後每次 rerun 直接輸出同一個字串
+_POC_CSS = "<style>" + _minify_css(POC_CSS_PATH.read_text(encoding="utf-8")) + "</style>"
+
+# st.html（Streamlit 1.33+）直接插入 HTML，不經 markdown 解析；舊版退回 st.markdown
+_HAS_ST_HTML = hasattr(st, "html")
+
+_SUBTITLE_PREFIX = '<p class="subtitle">'
+_SUBTITLE_SUFFIX = "</p>"
+
 
 def apply_poc_styles():
-    """應用 POC 級別的簡單樣式。"""
-    st.markdown(
-        """
-        <style>
-        /* Main container padding and width */
-        .main {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-
-        /* Reduce default Streamlit block spacing */
-        .block-container {
-            padding-top: 1rem !important;
-            padding-bottom: 1rem !important;
-        }
-
-        /* Reduce spacing between elements */
-        .stMarkdown {
-            margin-bottom: 0 !important;
-        }
-
-        div[data-testid="stVerticalBlock"] > div {
-            gap: 0.5rem !important;
-        }
-
-        /* Step indicator colors */
-        .step-active {
-            color: #2C5F7F;
-            font-weight: bold;
-        }
-
-        .step-completed {
-            color: #28A745;
-        }
-
-        .step-pending {
-            color: #6C757D;
-        }
-
-        /* Headers */
-        h1 {
-            color: #2C5F7F;
-            border-bottom: 3px solid #2C5F7F;
-            padding-bottom: 10px;
-        }
-
-        h2 {
-            color: #2C5F7F;
-            margin-top: 20px;
-        }
-
-        /* Success box */
-        .success-box {
-            background-color: #D4EDDA;
-            border-left: 4px solid #28A745;
-            padding: 1em;
-            border-radius: 0.5em;
-            margin: 1em 0;
-        }
-
-        /* Error box */
-        .error-box {
-            background-color: #F8D7DA;
-            border-left: 4px solid #DC3545;
-            padding: 1em;
-            border-radius: 0.5em;
-            margin: 1em 0;
-        }
-
-        /* Info box */
-        .info-box {
-            background-color: #D1ECF1;
-            border-left: 4px solid #17A2B8;
-            padding: 1em;
-            border-radius: 0.5em;
-            margin: 1em 0;
-        }
-
-        /* File uploader area - Unified dropzone with header */
-        [data-testid="stFileUploader"] {
-            margin-top: 0.5rem !important;
-        }
-
-        [data-testid="stFileUploader"] > section {
-            flex-direction: column !important;
-            display: flex !important;
-            border: 3px dashed #2C5F7F !important;
-            border-radius: 16px !important;
-            background: linear-gradient(135deg, #f0f7fa 0%, #e8f4f8 100%) !important;
-            overflow: visible !important;
-            height: auto !important;
-            min-height: auto !important;
-            max-height: none !important;
-        }
-
-        [data-testid="stFileUploader"] > section::before {
-            content: "📁 上傳 PDF 檔案";
-            display: block !important;
-            width: 100% !important;
-            order: -2 !important;
-            text-align: center;
-            color: #2C5F7F;
-            font-size: 1.2rem;
-            font-weight: bold;
-            padding: 0.8rem 1rem 0.2rem 1rem;
-            background: transparent;
-            box-sizing: border-box;
-        }
-
-        [data-testid="stFileUploader"] > section::after {
-            content: "拖放上傳 | 最多 5 個檔案，每個 50MB";
-            display: block !important;
-            width: 100% !important;
-            order: -1 !important;
-            text-align: center;
-            color: #666;
-            font-size: 0.8rem;
-            padding: 0.1rem 1rem 0.4rem 1rem;
-            background: transparent;
-            box-sizing: border-box;
-        }
-
-        /* Dropzone instructions area - more compact */
-        [data-testid="stFileUploaderDropzoneInstructions"] {
-            padding: 0.5rem 1.5rem !important;
-            justify-content: center !important;
-            align-items: center !important;
-            gap: 0.8rem !important;
-        }
-
-        /* Smaller upload icon */
-        [data-testid="stFileUploaderDropzoneInstructions"] svg {
-            width: 32px !important;
-            height: 32px !important;
-        }
-
-        [data-testid="stFileUploader"] > section:hover {
-            background: linear-gradient(135deg, #e8f4f8 0%, #d0e8f0 100%) !important;
-            box-shadow: 0 8px 25px rgba(44, 95, 127, 0.15) !important;
-        }
-
-        /* Dropzone text - compact */
-        [data-testid="stFileUploaderDropzoneInstructions"] span {
-            font-size: 0.9rem !important;
-            color: #2C5F7F !important;
-        }
-
-        [data-testid="stFileUploaderDropzoneInstructions"] small {
-            font-size: 0.75rem !important;
-            color: #888 !important;
-        }
-
-        /* Browse button inside dropzone - compact */
-        [data-testid="stFileUploader"] > section > span > button {
-            background-color: #2C5F7F !important;
-            color: white !important;
-            border: none !important;
-            padding: 0.4rem 1.2rem !important;
-            border-radius: 6px !important;
-            font-weight: 600 !important;
-            font-size: 0.85rem !important;
-            transition: all 0.2s ease !important;
-            margin: 0.3rem 0 0.6rem 0 !important;
-        }
-
-        [data-testid="stFileUploader"] > section > span > button:hover {
-            background-color: #1E3F52 !important;
-            transform: translateY(-2px) !important;
-            box-shadow: 0 4px 12px rgba(44, 95, 127, 0.3) !important;
-        }
-
-        /* Hide native Streamlit file list (we use our own expander) */
-        [data-testid="stFileUploaderFile"] {
-            display: none !important;
-        }
-
-        /* Primary buttons */
-        .stButton > button[kind="primary"] {
-            background-color: #2C5F7F;
-            color: white;
-            font-weight: bold;
-            border-radius: 6px;
-            padding: 10px 20px;
-            transition: all 0.3s ease;
-        }
-
-        .stButton > button[kind="primary"]:hover {
-            background-color: #1E3F52;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(44, 95, 127, 0.3);
-        }
-
-        /* Secondary buttons */
-        .stButton > button {
-            border-radius: 6px;
-            padding: 8px 16px;
-        }
-
-        /* Progress bar styling */
-        .stProgress > div > div > div > div {
-            background-color: #2C5F7F;
-        }
-
-        /* Divider */
-        hr {
-            border: none;
-            border-top: 2px solid #E0E0E0;
-            margin: 1.5em 0;
-        }
-
-        /* Text styling */
-        .subtitle {
-            color: #666;
-            font-size: 1.1em;
-            margin-bottom: 1em;
-        }
-
-        /* Metric cards */
-        [data-testid="metric-container"] {
-            background-color: #F8F9FA;
-            border-radius: 8px;
-            padding: 1em;
-            border-left: 4px solid #2C5F7F;
-        }
-
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    """應用 POC 級別的簡單樣式。
+
+    Streamlit 每次 rerun 都會重建頁面元素，未再次輸出的樣式會被移除，
+    因此不能以 session_state 只注入一次；改為每次輸出預先壓縮好的 _POC_CSS。
+    components.html 會渲染在 iframe 中，無法套用到主頁面，故不作為退路。
+    """
+    if _HAS_ST_HTML:
+        st.html(_POC_CSS)
+    else:
+        st.markdown(_POC_CSS, unsafe_allow_html=True)
 
 
 def apply_header_style(title: str, subtitle: str = ""):
@@ -242,7 +53,9 @@ def apply_header_style(title: str, subtitle: str = ""):
         title: 頁面標題
         subtitle: 副標題（可選）
     """
-    st.markdown(f"# {title}")
+    # 標題、副標題與分隔線合併為一個 markdown 元素輸出
     if subtitle:
-        st.markdown(f'<p class="subtitle">{subtitle}</p>', unsafe_allow_html=True)
-    st.markdown("---")
+        header = "# " + title + "\n\n" + _SUBTITLE_PREFIX + subtitle + _SUBTITLE_SUFFIX + "\n\n---"
+    else:
+        header = "# " + title + "\n\n---"
+    st.markdown(header, unsafe_allow_html=True)
@@ -0,0 +1,340 @@
+"""單元測試：APIClient 的 Excel 下載與任務等待流程.
+
+以 httpx.MockTransport 模擬後端，驗證各種回應組合下的請求順序。
+"""
+
+import json
+
+import httpx
+import pytest
+
+from services.api_client import APIClient
+
+
+EXCEL_URL = "/api/v1/quotations/q1/excel"
+EVENTS_URL = "/api/v1/tasks/gen-1/events"
+
+
+def _sse(task: dict) -> httpx.Response:
+    """建立只含一個 status 事件的 SSE 回應."""
+    body = f"event: status\ndata: {json.dumps(task)}\n\n"
+    return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, text=body)
+
+
+def _generating() -> httpx.Response:
+    """觸發產出時後端回傳的 202 回應."""
+    return httpx.Response(
+        202,
+        json={"success": True, "message": "Excel 產出中", "data": {"task_id": "gen-1"}},
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """輪詢退避不實際等待."""
+    monkeypatch.setattr("services.api_client.time.sleep", lambda seconds: None)
+
+
+@pytest.fixture
+def make_client():
+    """以 handler 模擬後端建立 APIClient，並記錄 (method, path)."""
+    clients = []
+
+    def _make(handler):
+        calls = []
+
+        def _record(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            return handler(request)
+
+        api = APIClient("http://test")
+        api.client.close()
+        api.client = httpx.Client(
+            base_url="http://test/api/v1", transport=httpx.MockTransport(_record)
+        )
+        clients.append(api)
+        return api, calls
+
+    yield _make
+
+    for api in clients:
+        api.close()
+
+
+class TestQuotationExcel:
+    """測試 get_quotation_excel 的輪詢狀態機."""
+
+    def test_ready_returns_content(self, make_client):
+        """檔案已就緒時只發出一次 GET."""
+        api, calls = make_client(lambda request: httpx.Response(200, content=b"xlsx"))
+
+        assert api.get_quotation_excel("q1") == b"xlsx"
+        assert calls == [("GET", EXCEL_URL)]
+
+    def test_generating_waits_over_sse(self, make_client):
+        """202 後透過 SSE 等待產出任務完成，再 GET 一次下載."""
+        state = {"ready": False}
+
+        def handler(request):
+            if request.url.path == EVENTS_URL:
+                state["ready"] = True
+                return _sse({"task_id": "gen-1", "status": "completed"})
+            if state["ready"]:
+                return httpx.Response(200, content=b"xlsx")
+            return _generating()
+
+        api, calls = make_client(handler)
+
+        assert api.get_quotation_excel("q1") == b"xlsx"
+        assert calls == [("GET", EXCEL_URL), ("GET", EVENTS_URL), ("GET", EXCEL_URL)]
+
+    def test_generating_probes_with_head_without_sse(self, make_client):
+        """後端不支援 SSE（404）時以 HEAD 探測，就緒後才 GET."""
+        state = {"heads": 0}
+
+        def handler(request):
+            if request.url.path == EVENTS_URL:
+                return httpx.Response(404)
+            if request.method == "HEAD":
+                state["heads"] += 1
+                return httpx.Response(200 if state["heads"] >= 2 else 202)
+            if state["heads"] >= 2:
+                return httpx.Response(200, content=b"xlsx")
+            return _generating()
+
+        api, calls = make_client(handler)
+
+        assert api.get_quotation_excel("q1") == b"xlsx"
+        assert calls == [
+            ("GET", EXCEL_URL),
+            ("GET", EVENTS_URL),
+            ("HEAD", EXCEL_URL),
+            ("HEAD", EXCEL_URL),
+            ("GET", EXCEL_URL),
+        ]
+
+    def test_head_not_allowed_falls_back_to_get_polling(self, make_client):
+        """後端不支援 HEAD（405）時改以 GET 輪詢，不再發出 HEAD."""
+        state = {"gets": 0}
+
+        def handler(request):
+            if request.url.path == EVENTS_URL:
+                return httpx.Response(404)
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            state["gets"] += 1
+            if state["gets"] >= 3:
+                return httpx.Response(200, content=b"xlsx")
+            return httpx.Response(202, json={"success": True, "data": {}})
+
+        api, calls = make_client(handler)
+
+        assert api.get_quotation_excel("q1") == b"xlsx"
+        assert calls.count(("HEAD", EXCEL_URL)) == 1
+        assert calls[-1] == ("GET", EXCEL_URL)
+        assert state["gets"] == 3
+
+    def test_failed_generation_raises_without_retrigger(self, make_client):
+        """產出任務失敗時回報錯誤，不重新觸發產出."""
+
+        def handler(request):
+            if request.url.path == EVENTS_URL:
+                return _sse({"task_id": "gen-1", "status": "failed", "error": "範本損毀"})
+            return _generating()
+
+        api, calls = make_client(handler)
+
+        with pytest.raises(RuntimeError, match="範本損毀"):
+            api.get_quotation_excel("q1", max_wait=1)
+
+        assert calls == [("GET", EXCEL_URL), ("GET", EVENTS_URL)]
+
+    def test_out_path_streams_to_file(self, make_client, tmp_path):
+        """指定 out_path 時寫入檔案並回傳路徑，不留下 .part 檔."""
+        api, _ = make_client(lambda request: httpx.Response(200, content=b"xlsx"))
+        dest = tmp_path / "quotation.xlsx"
+
+        assert api.get_quotation_excel("q1", out_path=dest) == dest
+        assert dest.read_bytes() == b"xlsx"
+        assert list(tmp_path.iterdir()) == [dest]
+
+
+class TestWaitForCompletion:
+    """測試 wait_for_completion 的 SSE 與輪詢退路."""
+
+    def test_completed_over_sse(self, make_client):
+        """SSE 回報完成時不再輪詢."""
+        api, calls = make_client(
+            lambda request: _sse({"task_id": "t1", "status": "completed", "result": {"n": 1}})
+        )
+
+        result = api.wait_for_completion("t1")
+
+        assert result["data"]["status"] == "completed"
+        assert result["data"]["result"] == {"n": 1}
+        assert calls == [("GET", "/api/v1/tasks/t1/events")]
+
+    def test_falls_back_to_polling_without_sse(self, make_client):
+        """後端不支援 SSE（404）時改以輪詢任務狀態."""
+        state = {"polls": 0}
+
+        def handler(request):
+            if request.url.path.endswith("/events"):
+                return httpx.Response(404)
+            state["polls"] += 1
+            status = "completed" if state["polls"] >= 2 else "processing"
+            return httpx.Response(200, json={"data": {"task_id": "t1", "status": status}})
+
+        api, calls = make_client(handler)
+
+        result = api.wait_for_completion("t1")
+
+        assert result["data"]["status"] == "completed"
+        assert calls == [
+            ("GET", "/api/v1/tasks/t1/events"),
+            ("GET", "/api/v1/tasks/t1"),
+            ("GET", "/api/v1/tasks/t1"),
+        ]
+
+    def test_on_update_receives_every_polled_status(self, make_client):
+        """輪詢時每次取得的狀態都會傳給 on_update."""
+        state = {"polls": 0}
+
+        def handler(request):
+            if request.url.path.endswith("/events"):
+                return httpx.Response(404)
+            state["polls"] += 1
+            status = "completed" if state["polls"] >= 2 else "processing"
+            return httpx.Response(200, json={"data": {"task_id": "t1", "status": status}})
+
+        api, _ = make_client(handler)
+        updates = []
+
+        api.wait_for_completion("t1", on_update=updates.append)
+
+        assert [task["status"] for task in updates] == ["processing", "completed"]
+
+
+class TestWaitForAll:
+    """測試 wait_for_all 的批次輪詢."""
+
+    def test_batch_polling_reports_all_tasks(self, make_client):
+        """每次輪詢一個批次請求，on_update 取得所有任務的最新狀態."""
+        state = {"polls": 0}
+
+        def handler(request):
+            state["polls"] += 1
+            done = state["polls"] >= 2
+            tasks = [
+                {"task_id": "a", "status": "completed", "result": {"n": 1}},
+                {"task_id": "b", "status": "completed" if done else "processing"},
+            ]
+            return httpx.Response(200, json={"data": {"tasks": tasks}})
+
+        api, calls = make_client(handler)
+        updates = []
+
+        result = api.wait_for_all(["a", "b"], on_update=updates.append)
+
+        assert result["a"]["result"] == {"n": 1}
+        assert result["b"]["status"] == "completed"
+        assert calls == [("GET", "/api/v1/tasks"), ("GET", "/api/v1/tasks")]
+        assert [update["b"]["status"] for update in updates] == ["processing", "completed"]
+        assert all(set(update) == {"a", "b"} for update in updates)
+
+
+class TestConditionalGet:
+    """測試 ETag 條件式 GET 快取."""
+
+    def test_not_modified_returns_cached_result(self, make_client):
+        """304 時回傳上次解析的結果."""
+
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, headers={"ETag": '"v1"'}, json={"data": {"items": [1]}})
+
+        api, calls = make_client(handler)
+
+        first = api.get_parse_result("d1")
+        second = api.get_parse_result("d1")
+
+        assert second is first
+        assert len(calls) == 2
+
+    def test_cache_is_bounded(self, make_client, monkeypatch):
+        """超過上限時淘汰最久未使用的項目."""
+        monkeypatch.setattr("services.api_client.ETAG_CACHE_MAXSIZE", 2)
+        api, _ = make_client(
+            lambda request: httpx.Response(200, headers={"ETag": '"v1"'}, json={"data": {}})
+        )
+
+        for document_id in ("d1", "d2", "d3"):
+            api.get_parse_result(document_id)
+
+        assert list(api._etag_cache) == [
+            "/documents/d2/parse-result",
+            "/documents/d3/parse-result",
+        ]
+
+    def test_entry_evicted_during_request(self, make_client):
+        """請求期間項目被其他 session 淘汰時，304 仍回傳本地副本並重新放入快取."""
+        key = "/documents/d1/parse-result"
+        api = None
+
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                api._etag_cache.pop(key)
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, headers={"ETag": '"v1"'}, json={"data": {"items": [1]}})
+
+        api, _ = make_client(handler)
+
+        first = api.get_parse_result("d1")
+        second = api.get_parse_result("d1")
+
+        assert second is first
+        assert api._etag_cache[key][1] is first
+
+
+class TestRetryTransient:
+    """測試冪等 GET 的暫時性錯誤重試."""
+
+    def test_protocol_error_is_retried(self, make_client):
+        """連線中斷後重試並取得結果."""
+        state = {"calls": 0}
+
+        def handler(request):
+            state["calls"] += 1
+            if state["calls"] == 1:
+                raise httpx.RemoteProtocolError("server disconnected", request=request)
+            return httpx.Response(200, json={"data": {"status": "completed"}})
+
+        api, calls = make_client(handler)
+
+        assert api.get_task_status("t1")["data"]["status"] == "completed"
+        assert len(calls) == 2
+
+    def test_timeout_is_not_retried(self, make_client):
+        """讀取逾時直接拋出，不重複等待."""
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        api, calls = make_client(handler)
+
+        with pytest.raises(httpx.ReadTimeout):
+            api.get_task_status("t1")
+        assert len(calls) == 1
+
+    def test_health_check_fails_fast(self, make_client):
+        """health_check 不重試，後端無回應時立即失敗."""
+
+        def handler(request):
+            raise httpx.RemoteProtocolError("server disconnected", request=request)
+
+        api, calls = make_client(handler)
+
+        with pytest.raises(httpx.RemoteProtocolError):
+            api.health_check()
+        assert len(calls) == 1
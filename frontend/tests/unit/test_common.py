@@ -0,0 +1,60 @@
+"""單元測試：format_error_message 的錯誤分類."""
+
+import httpx
+import pytest
+
+pytest.importorskip("streamlit")
+
+from utils.common import format_error_message  # noqa: E402
+
+
+class TestFormatErrorMessage:
+    """測試錯誤訊息格式化."""
+
+    def test_network_timeout_keeps_context(self):
+        """httpx 逾時歸類為網路逾時並保留上下文."""
+        error = httpx.ReadTimeout("timed out")
+
+        assert format_error_message(error, "上傳") == "上傳：請求超時，請檢查網路連線"
+
+    def test_task_timeout_is_not_reported_as_network_error(self):
+        """APIClient 的任務逾時（內建 TimeoutError）保留原始訊息."""
+        error = TimeoutError("Task t1 did not complete within 300 seconds")
+
+        assert format_error_message(error, "解析") == (
+            "解析：Task t1 did not complete within 300 seconds"
+        )
+
+    def test_connection_error_subclass(self):
+        """ConnectionError 的子類別同樣歸類為無法連線."""
+        error = ConnectionRefusedError("refused")
+
+        assert format_error_message(error) == "無法連接到伺服器，請檢查後端是否運行"
+
+    def test_file_not_found(self):
+        """FileNotFoundError 歸類為找不到資源."""
+        assert format_error_message(FileNotFoundError("x.pdf"), "讀取") == "找不到資源：讀取"
+
+    def test_http_404(self):
+        """HTTP 404 歸類為找不到資源."""
+        request = httpx.Request("GET", "http://test/api/v1/documents/d1")
+        response = httpx.Response(404, request=request)
+        error = httpx.HTTPStatusError("404", request=request, response=response)
+
+        assert format_error_message(error, "文件") == "找不到資源：文件"
+
+    def test_string_fallback(self):
+        """其他例外依訊息內容分類."""
+        assert format_error_message(ValueError("File too large")) == "檔案過大，請使用小於 50MB 的檔案"
+        assert format_error_message(ValueError("boom"), "處理") == "處理：boom"
+
+    def test_string_classified_connection_keeps_context(self):
+        """字串比對分類的連線錯誤與類型分類使用相同的上下文格式."""
+        error = httpx.RemoteProtocolError("connection closed by peer")
+
+        assert format_error_message(error, "上傳") == (
+            "上傳：無法連接到伺服器，請檢查後端是否運行"
+        )
+        assert format_error_message(ConnectionRefusedError("refused"), "上傳") == (
+            format_error_message(error, "上傳")
+        )
@@ -1,18 +1,65 @@
 """Common utilities for POC - error handling and caching helpers."""
 
 import streamlit as st
-import functools
-from typing import Callable, Any, Optional
+import httpx
+from functools import lru_cache
+from typing import Callable, Any
 import logging
+import os
+import re
+
+from services.api_client import APIClient, get_client
 
 
 logger = logging.getLogger(__name__)
 
+# 錯誤處理輔助函數每次 rerun 都可能被呼叫，預先綁定常用的函數
+_st_error = st.error
+_st_success = st.success
+_log_error = logger.error
+
+# 後端位址與 API key 於匯入時決定一次（.env 已由 app.py 在匯入前載入）
+_BACKEND_BASE_URL = (
+    f"http://{os.getenv('BACKEND_HOST', 'localhost')}:{os.getenv('BACKEND_PORT', '8000')}"
+)
+_API_KEY = os.getenv("API_KEY", "")
+
+# 訊息本身已足以說明問題的例外，記錄時不附 traceback
+_BENIGN_EXCEPTIONS = (ValueError, KeyError)
+
+# 訊息前綴
+_ERROR_PREFIX = "❌ "
+_SUCCESS_PREFIX = "✅ "
+
+# 依例外類型判斷的錯誤訊息（優先於字串比對，依序以 isinstance 檢查）。
+# 內建 TimeoutError 不列入：APIClient 以它表示任務/Excel 產出超過 max_wait，
+# 並非網路逾時，交由字串比對保留原始訊息
+_ERROR_TYPE_MESSAGES = (
+    (httpx.TimeoutException, "請求超時，請檢查網路連線"),
+    ((ConnectionError, httpx.ConnectError), "無法連接到伺服器，請檢查後端是否運行"),
+)
+
+# 常見錯誤模式：以錨定在開頭的 lookahead 依序嘗試，維持原本的判斷優先順序
+# （例如同時含 "connection" 與 "timeout" 時仍歸類為超時）；不分大小寫，免轉小寫複本
+_ERROR_PATTERN_RE = re.compile(
+    r"(?=.*(404|not found))|(?=.*(timeout))|(?=.*(connection))|(?=.*(file too large))",
+    re.DOTALL | re.IGNORECASE,
+)
+# 依群組編號對應的訊息（群組 1「找不到資源」需附加 context，由 _not_found_message 處理）
+_ERROR_MESSAGES = (
+    None,
+    "找不到資源",
+    "請求超時，請檢查網路連線",
+    "無法連接到伺服器，請檢查後端是否運行",
+    "檔案過大，請使用小於 50MB 的檔案",
+)
+
 
 def safe_api_call(
     func: Callable,
     error_msg: str = "操作失敗",
     show_details: bool = True,
+    expected_exceptions: tuple[type[Exception], ...] = (),
 ) -> Any:
     """
     簡單的錯誤包裝器 - POC 級別。
@@ -20,7 +67,9 @@ def safe_api_call(
     Args:
         func: 要執行的函數
         error_msg: 錯誤訊息前綴
-        show_details: 是否顯示詳細錯誤
+        show_details: 是否顯示詳細錯誤（為 False 時日誌也不附 traceback）
+        expected_exceptions: 預期內的例外類型（例如 httpx.HTTPStatusError），
+            僅以 debug 等級記錄且不擷取 traceback
 
     Returns:
         函數結果或 None（出錯時）
@@ -29,29 +78,24 @@ def safe_api_call(
         return func()
     except Exception as e:
         error_detail = str(e) if show_details else ""
-        full_msg = f"{error_msg}" + (f"：{error_detail}" if error_detail else "")
-        st.error(f"❌ {full_msg}")
-        logger.error(f"{error_msg}: {str(e)}", exc_info=True)
+        full_msg = error_msg + "：" + error_detail if error_detail else error_msg
+        _st_error(_ERROR_PREFIX + full_msg)
+        if isinstance(e, expected_exceptions):
+            logger.debug("%s: %s", error_msg, e)
+        else:
+            exc_info = show_details and not isinstance(e, _BENIGN_EXCEPTIONS)
+            _log_error("%s: %s", error_msg, e, exc_info=exc_info)
         return None
 
 
-def get_cached_api_client():
+def get_cached_api_client() -> APIClient:
     """
-    獲取 API 客戶端（使用簡單的 session state 緩存）。
+    獲取 API 客戶端（get_client 以 functools.cache 在所有 session 間共用同一個連線池）。
 
     Returns:
         APIClient 實例
     """
-    if "api_client" not in st.session_state:
-        from services.api_client import APIClient
-        import os
-
-        backend_host = os.getenv("BACKEND_HOST", "localhost")
-        backend_port = os.getenv("BACKEND_PORT", "8000")
-        base_url = f"http://{backend_host}:{backend_port}"
-        st.session_state.api_client = APIClient(base_url=base_url)
-
-    return st.session_state.api_client
+    return get_client(base_url=_BACKEND_BASE_URL, api_key=_API_KEY)
 
 
 def format_error_message(error: Exception, context: str = "") -> str:
@@ -65,19 +109,49 @@ def format_error_message(error: Exception, context: str = "") -> str:
     Returns:
         格式化的錯誤訊息
     """
-    error_str = str(error)
-
-    # 常見錯誤模式
-    if "404" in error_str or "not found" in error_str.lower():
-        return f"找不到資源：{context}" if context else "找不到資源"
-    elif "timeout" in error_str.lower():
-        return "請求超時，請檢查網路連線"
-    elif "connection" in error_str.lower():
-        return "無法連接到伺服器，請檢查後端是否運行"
-    elif "file too large" in error_str.lower():
-        return "檔案過大，請使用小於 50MB 的檔案"
-    else:
+    for error_types, message in _ERROR_TYPE_MESSAGES:
+        if isinstance(error, error_types):
+            return _category_message(message, context)
+    if isinstance(error, FileNotFoundError) or (
+        isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 404
+    ):
+        return _not_found_message(context)
+
+    # 其他例外才轉為字串比對
+    return _classify(str(error), context)
+
+
+@lru_cache(maxsize=256)
+def _classify(error_str: str, context: str) -> str:
+    """
+    將錯誤字串對應為用戶友好的訊息。
+
+    結果以 lru_cache 快取：後端離線時每次 rerun 產生的相同錯誤只比對一次。
+
+    Args:
+        error_str: 錯誤字串
+        context: 上下文信息
+
+    Returns:
+        格式化的錯誤訊息
+    """
+    # 常見錯誤模式（一次比對）
+    match = _ERROR_PATTERN_RE.match(error_str)
+    if match is None:
         return f"{context}：{error_str}" if context else error_str
+    if match.lastindex == 1:
+        return _not_found_message(context)
+    return _category_message(_ERROR_MESSAGES[match.lastindex], context)
+
+
+def _category_message(message: str, context: str) -> str:
+    """錯誤類別的訊息（附上下文），類型比對與字串比對共用同一格式。"""
+    return f"{context}：{message}" if context else message
+
+
+def _not_found_message(context: str) -> str:
+    """找不到資源的訊息（附上下文）。"""
+    return f"找不到資源：{context}" if context else "找不到資源"
 
 
 def display_user_friendly_error(error: Exception, context: str = ""):
@@ -89,8 +163,8 @@ def display_user_friendly_error(error: Exception, context: str = ""):
         context: 上下文信息
     """
     msg = format_error_message(error, context)
-    st.error(f"❌ {msg}")
-    logger.error(f"Error in {context}: {str(error)}", exc_info=True)
+    _st_error(_ERROR_PREFIX + msg)
+    _log_error("Error in %s: %s", context, error, exc_info=True)
 
 
 def display_success_message(message: str, icon: str = "✅"):
@@ -101,4 +175,4 @@ def display_success_message(message: str, icon: str = "✅"):
         message: 訊息內容
         icon: 圖標
     """
-    st.success(f"{icon} {message}")
+    _st_success((_SUCCESS_PREFIX if icon == "✅" else icon + " ") + message)